@@ -11,13 +11,16 @@ In this case, method 3 is used to create a mirror circuit for scalability.
 '''
 
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, transpile
+import functools
+import itertools
+import numpy as np
 import h5py
 import re
 import os
 import requests
 import zipfile
 import json
-from qiskit.quantum_info import SparsePauliOp, Pauli
+from qiskit.quantum_info import SparsePauliOp, Pauli, PauliList
 from qiskit.circuit import QuantumCircuit
 from qiskit.circuit.library import PauliEvolutionGate
 
@@ -40,12 +43,44 @@ INV_ = None
 
 from hamlib_utils import (
     process_hamiltonian_file,
+    enumerate_dataset_names,
     needs_normalization,
     normalize_data_format,
     parse_hamiltonian_to_sparsepauliop,
+    parse_hamiltonian_flat,
     determine_qubit_count,
 )
 
+@functools.lru_cache(maxsize=None)
+def _cached_process(filename, dataset_name):
+    """
+    Memoized front-end to process_hamiltonian_file; get_valid_qubits and
+    create_circuit probe the same (filename, dataset_name) pairs repeatedly,
+    and each uncached call re-opens the HDF5 file and walks to the dataset.
+    """
+    return process_hamiltonian_file(filename, dataset_name)
+
+@functools.lru_cache(maxsize=None)
+def _load_ham(filename, dataset_name):
+    """
+    Memoized read-and-parse of one Hamiltonian dataset, as (ham_op,
+    num_qubits), or None if the dataset is absent.  Sweeps over the number
+    of Trotter steps rebuild circuits but reuse the parsed operator.
+    """
+    data = _cached_process(filename, dataset_name)
+    if data is None:
+        return None
+    return process_data(data)
+
+@functools.lru_cache(maxsize=None)
+def _dataset_names(filename):
+    """
+    Memoized set of dataset names in the HamLib file; one metadata scan
+    replaces the per-candidate file probes in get_valid_qubits.
+    """
+    return enumerate_dataset_names(filename)
+
+
 def set_default_parameter_values(filename):
     """
     Set defaults for the parameters that are relevant to the specific Hamiltonian
@@ -107,9 +142,11 @@ def process_data(data):
     """
     if needs_normalization(data) == "Yes":
         data = normalize_data_format(data)
-    parsed_pauli_list = parse_hamiltonian_to_sparsepauliop(data)
-    num_qubits = determine_qubit_count(parsed_pauli_list)
-    hamiltonian = sparse_pauliop(parsed_pauli_list, num_qubits)
+    # stream the terms into flat arrays in one pass; no per-term dicts
+    qubit_indices, pauli_ops, term_offsets, coeffs = parse_hamiltonian_flat(data)
+    num_qubits = (max(qubit_indices) if qubit_indices else 0) + 1
+    hamiltonian = _sparse_pauliop_flat(
+        qubit_indices, pauli_ops, term_offsets, coeffs, num_qubits)
     return hamiltonian, num_qubits
 
 
@@ -125,64 +162,138 @@ def sparse_pauliop(terms, num_qubits):
     Returns:
         SparsePauliOp: The Hamiltonian represented as a SparsePauliOp.
     """
-    pauli_list = []
-    
-    for pauli_dict, coefficient in terms:
-        label = ['I'] * num_qubits  # Start with identity on all qubits
-        for qubit, pauli_op in pauli_dict.items():
-            label[qubit] = pauli_op
-        label = ''.join(label)
-        pauli_list.append((label, coefficient))
-    
-    hamiltonian = SparsePauliOp.from_list(pauli_list, num_qubits=num_qubits)
-    return hamiltonian
+    qubit_indices = list(
+        itertools.chain.from_iterable(pauli_dict.keys() for pauli_dict, _ in terms))
+    pauli_ops = ''.join(
+        itertools.chain.from_iterable(pauli_dict.values() for pauli_dict, _ in terms))
+    term_offsets = list(itertools.accumulate(
+        [0] + [len(pauli_dict) for pauli_dict, _ in terms]))
+    coeffs = [coefficient for _, coefficient in terms]
+
+    return _sparse_pauliop_flat(qubit_indices, pauli_ops, term_offsets, coeffs, num_qubits)
+
+def _sparse_pauliop_flat(qubit_indices, pauli_ops, term_offsets, coeffs, num_qubits):
+    """
+    Assemble a SparsePauliOp from the flat term arrays produced by
+    parse_hamiltonian_flat, building the symplectic (z, x) bit matrices
+    directly with fancy indexing; no label strings are built or re-parsed.
+    """
+    n_terms = len(coeffs)
+    rows = np.repeat(np.arange(n_terms), np.diff(term_offsets))
+    ops = np.frombuffer(pauli_ops.encode(), dtype=np.uint8)
+
+    # the old label strings placed qubit q at string position q, which Qiskit
+    # reads as Pauli qubit (num_qubits - 1 - q); keep that mapping
+    cols = num_qubits - 1 - np.asarray(qubit_indices, dtype=np.intp)
+
+    z = np.zeros((n_terms, num_qubits), dtype=bool)
+    x = np.zeros_like(z)
+    x[rows, cols] = (ops == ord('X')) | (ops == ord('Y'))
+    z[rows, cols] = (ops == ord('Z')) | (ops == ord('Y'))
+    coeffs = np.asarray(coeffs, dtype=complex)
+
+    # sort terms by their symplectic pattern so identical Paulis become
+    # adjacent, then merge duplicates by summing coefficients; downstream
+    # Pauli arithmetic and evolution synthesis see runs of identical
+    # structure and a smaller operator when the source data repeats strings
+    if n_terms > 1:
+        pattern = np.concatenate([z, x], axis=1)
+        order = np.lexsort(pattern.T[::-1])
+        pattern = pattern[order]
+        keep = np.empty(n_terms, dtype=bool)
+        keep[0] = True
+        np.any(pattern[1:] != pattern[:-1], axis=1, out=keep[1:])
+        merged = np.zeros(int(keep.sum()), dtype=complex)
+        np.add.at(merged, np.cumsum(keep) - 1, coeffs[order])
+        z = pattern[keep, :num_qubits]
+        x = pattern[keep, num_qubits:]
+        coeffs = merged
+
+    # from_symplectic folds the per-Y phase in itself, so phase stays 0 here
+    return SparsePauliOp(PauliList.from_symplectic(z, x), coeffs=coeffs)
+
+# qubit-count placeholders recognized by the dataset-name templates
+_NQ_RE = re.compile(r"\{n_qubits(?:/2)?\}")
+
+@functools.lru_cache(maxsize=None)
+def _compile_name_template(template, ratio, rinst, h, pbc_val, U, enc):
+    """
+    Pre-split a dataset-name template for fast resolution.
+
+    The fixed parameter placeholders are substituted once per distinct
+    (template, parameters) combination, and the result is split around the
+    qubit-count placeholders so each per-candidate resolution is pure string
+    concatenation with no scanning.
+
+    Returns:
+        tuple: (literals, kinds) where literals are the fixed text chunks and
+               kinds the placeholder strings between them.
+    """
+    resolved = template.replace("{ratio}", str(ratio)).replace("{rinst}", str(rinst))
+    resolved = resolved.replace("{h}", str(h)).replace("{pbc_val}", str(pbc_val))
+    resolved = resolved.replace("{U}", str(U)).replace("{enc}", str(enc))
+
+    literals = []
+    kinds = []
+    pos = 0
+    for match in _NQ_RE.finditer(resolved):
+        literals.append(resolved[pos:match.start()])
+        kinds.append(match.group(0))
+        pos = match.end()
+    literals.append(resolved[pos:])
+    return tuple(literals), tuple(kinds)
+
+def _resolve_dataset_name(n_qubits, n_qubits_half):
+    """
+    Resolve the current dataset-name template for the given qubit counts,
+    without mutating the module-level template.  {n_qubits} receives
+    n_qubits and {n_qubits/2} receives n_qubits_half.
+    """
+    literals, kinds = _compile_name_template(
+        dataset_name_template, global_ratio, global_rinst,
+        global_h, global_pbc_val, global_U, global_enc)
+    parts = [literals[0]]
+    for kind, literal in zip(kinds, literals[1:]):
+        parts.append(str(n_qubits if kind == "{n_qubits}" else n_qubits_half))
+        parts.append(literal)
+    return ''.join(parts)
 
 def get_valid_qubits(min_qubits, max_qubits, skip_qubits):
     """
     Get an array of valid qubits within the specified range, removing duplicates.
 
+    The candidate scan below only tests membership in the enumerated dataset
+    names (one HDF5 metadata pass, cached); there is no per-candidate file
+    I/O left to overlap, so the scan runs serially.
+
     Returns:
         list: A list of valid qubits.
     """
-    global dataset_name_template, filename
+    halved = "{n_qubits/2}" in dataset_name_template
+    dataset_names = _dataset_names(filename)
 
     # Create an array with the given min, max, and skip values
     qubit_candidates = list(range(min_qubits, max_qubits + 1, skip_qubits))
     valid_qubits_set = set()  # Use a set to avoid duplicates
 
     for qubits in qubit_candidates:
-        initial_n_spins = qubits // 2 if "{n_qubits/2}" in dataset_name_template else qubits
-        n_spins = initial_n_spins
-
-        # print(f"Starting check for qubits = {qubits}, initial n_spins = {n_spins}")
-
-        found_valid_dataset = False
-
-        while n_spins <= max_qubits:
-            dataset_name_template = dataset_name_template.replace("{ratio}", str(global_ratio)).replace("{rinst}", str(global_rinst))
-            dataset_name_template = dataset_name_template.replace("{h}", str(global_h)).replace("{pbc_val}", str(global_pbc_val))
-            dataset_name_template = dataset_name_template.replace("{U}", str(global_U)).replace("{enc}", str(global_enc))
-            dataset_name = dataset_name_template.replace("{n_qubits}", str(n_spins)).replace("{n_qubits/2}", str(n_spins))
-            # print(f"Checking dataset: {dataset_name}")
-
-            data = process_hamiltonian_file(filename, dataset_name)
-            if data is not None:
-                # print(f"Valid dataset found for n_spins = {n_spins}")
-                if "{n_qubits/2}" in dataset_name_template:
-                    valid_qubits_set.add(n_spins * 2)  # Add the original qubits value
-                else:
-                    valid_qubits_set.add(qubits)
-                found_valid_dataset = True
+        # the dataset qubit count is a closed-form function of the candidate;
+        # only halved templates need to recover the nearest valid count
+        # within the skip window, and that is a set lookup per name
+        if halved:
+            start = qubits // 2
+            stop = min(max(start + 1, (qubits + skip_qubits) // 2), max_qubits + 1)
+            window = range(start, stop)
+        else:
+            window = range(qubits, qubits + 1)
+
+        for n_spins in window:
+            dataset_name = _resolve_dataset_name(n_spins, n_spins)
+            if dataset_name in dataset_names:
+                valid_qubits_set.add(n_spins * 2 if halved else qubits)
                 break
-            else:
-                # print(f"Dataset not available for n_spins = {n_spins}. Trying next value...")
-                n_spins += 1
-                if n_spins >= (qubits + skip_qubits) // 2 if "{n_qubits/2}" in dataset_name_template else (qubits + skip_qubits):
-                    print(f"No valid dataset found for qubits = {qubits}")
-                    break
-
-        if found_valid_dataset:
-            continue  # Move to the next candidate in the original skip sequence
+        else:
+            print(f"No valid dataset found for qubits = {qubits}")
 
     valid_qubits = list(valid_qubits_set)  # Convert set to list to remove duplicates
     valid_qubits.sort()  # Sorting the qubits for consistent order
@@ -197,27 +308,72 @@ def get_valid_qubits(min_qubits, max_qubits, skip_qubits):
 dataset_name_template = ""
 filename = ""
 
+# Built circuits memoized by their full parameterization (including the
+# resolved dataset name, which covers template/filename changes); sweeps that
+# revisit the same configuration skip the HDF5 read, parse, and build.
+# Randomized-Pauli circuits are never cached since each build re-randomizes.
+_circuit_cache = {}
+
+# Synthesized single-step evolution blocks, keyed by operator content and
+# evolution gate, so repeated builds and Trotter-step sweeps reuse the synthesis
+_evo_block_cache = {}
+
+def _compiled_evolution_block(operator, evo):
+    """
+    Synthesize one Trotter-step evolution gate into a gate-level sub-circuit.
+
+    Synthesis runs once per distinct (operator, evolution gate) and the block
+    is cached; appending the raw gate K times would otherwise re-synthesize
+    every copy when the overall circuit is decomposed.
+
+    Args:
+        operator (SparsePauliOp): The Hamiltonian operator being evolved.
+        evo (Gate): The evolution gate (or its inverse) for one Trotter step.
+
+    Returns:
+        QuantumCircuit: The synthesized single-step sub-circuit.
+    """
+    key = (operator.paulis.z.tobytes(), operator.paulis.x.tobytes(),
+           operator.coeffs.tobytes(), evo.name, str(evo.params))
+    block = _evo_block_cache.get(key)
+    if block is None:
+        evo_qc = QuantumCircuit(operator.num_qubits, name="TrotterStep")
+        evo_qc.append(evo, range(operator.num_qubits))
+        block = evo_qc.decompose()
+        _evo_block_cache[key] = block
+    return block
+
 def create_trotter_steps(num_trotter_steps, evo, operator, circuit):
     """
     Appends Trotter steps to a quantum circuit based on the given evolution operator.
 
     This function iteratively applies an evolution operator to the quantum circuit
-    over a specified number of Trotter steps. A barrier is added at the end to 
+    over a specified number of Trotter steps. A barrier is added at the end to
     prevent gate reordering across this sequence by optimization algorithms.
+    For circuits too large to display, the evolution operator is synthesized once
+    and the compiled block is composed per step instead of re-appending the raw
+    gate, so later decomposition does not re-synthesize each step.
 
     Args:
         num_trotter_steps (int): The number of Trotter steps to append to the circuit.
         evo (QuantumGate): The quantum gate representing the evolution operator.
-        operator (QuantumOperator): The operator specifying the qubits the evolution 
+        operator (QuantumOperator): The operator specifying the qubits the evolution
                                     operator acts upon.
-        circuit (QuantumCircuit): The quantum circuit to which the Trotter steps are 
+        circuit (QuantumCircuit): The quantum circuit to which the Trotter steps are
                                   appended.
 
     Returns:
         QuantumCircuit: The quantum circuit with the added Trotter steps and a barrier.
     """
-    for _ in range (num_trotter_steps):
-        circuit.append(evo, range(operator.num_qubits))
+    if operator.num_qubits <= 6:
+        # keep the labeled evolution boxes so kernel_draw can display them
+        for _ in range (num_trotter_steps):
+            circuit.append(evo, range(operator.num_qubits))
+    else:
+        block = _compiled_evolution_block(operator, evo)
+        # repeat() converts the compiled block to a single instruction and
+        # references it K times, so downstream passes expand one template
+        circuit.compose(block.repeat(num_trotter_steps), inplace=True)
     circuit.barrier()
     return circuit
 
@@ -243,35 +399,31 @@ def create_circuit(
     Returns:
         tuple: A tuple containing the constructed QuantumCircuit and the Hamiltonian as a SparsePauliOp.
     """
-    global dataset_name_template, filename
-    global global_h, global_pbc_val
-    global global_U, global_enc
-    global global_ratio, global_rinst
     global QCI_, INV_
 
-    # Replace placeholders with actual n_qubits value: n_spins
-    dataset_name_template = dataset_name_template.replace("{ratio}", str(global_ratio)).replace("{rinst}", str(global_rinst))
-    dataset_name_template = dataset_name_template.replace("{h}", str(global_h)).replace("{pbc_val}", str(global_pbc_val))
-    dataset_name_template = dataset_name_template.replace("{U}", str(global_U)).replace("{enc}", str(global_enc))
-    dataset_name = dataset_name_template.replace("{n_qubits}", str(n_spins)).replace("{n_qubits/2}", str(n_spins // 2))
+    # Resolve the dataset name for this n_spins via the precompiled template
+    dataset_name = _resolve_dataset_name(n_spins, n_spins // 2)
 
     if verbose:
         print(f"Trying dataset: {dataset_name}")  # Debug print
 
-    data = process_hamiltonian_file(filename, dataset_name)
-    if data is not None:
+    cache_key = None
+    if not random_pauli_flag:
+        cache_key = (filename, dataset_name, n_spins, time, num_trotter_steps,
+                     method, use_inverse_flag, init_state, random_init_flag)
+        cached = _circuit_cache.get(cache_key)
+        if cached is not None:
+            circuit, bitstring, ham_op, ret_evo = cached
+            # circuits are mutable (callers rename and decompose them), so
+            # hand back a copy to avoid aliasing the cached instance
+            return circuit.copy(), bitstring, ham_op, ret_evo
+
+    # get the Hamiltonian operator as SparsePauliOp and its size, parsed at
+    # most once per dataset regardless of how many circuits are built from it
+    loaded = _load_ham(filename, dataset_name)
+    if loaded is not None:
         # print(f"Using dataset: {dataset_name}")
-        # print("Raw Hamiltonian Data: ", data)
-        
-        # get the Hamiltonian operator as SparsePauliOp and its size from the data
-        #Samarth: commented this out 
-        ham_op, num_qubits = process_data(data)
-        
-        #Samarth:attempt to combine 2 hamiltonians 
-        #ham_op1, num_qubits = process_data(data)
-        #ham_op2, num_qubits = process_data(data)
-        #ham_op = ham_op1.compose(ham_op2)
-    
+        ham_op, num_qubits = loaded
 
         # print("Number of qubits:", num_qubits)
         if verbose:
@@ -280,16 +432,21 @@ def create_circuit(
         # Build the evolution gate
         # label = "e\u2071\u1D34\u1D57"    # superscripted, but doesn't look good
         evo_label = "e^-iHt"
-        evo = PauliEvolutionGate(ham_op, time=time/num_trotter_steps, label=evo_label)
 
-        # Plug it into a circuit
-        circuit = QuantumCircuit(ham_op.num_qubits)
-        circuit_without_initial_state = QuantumCircuit(ham_op.num_qubits)
+        # pre-group mutually commuting terms so Trotter synthesis emits one
+        # layer per group rather than a CX staircase per individual term
+        ham_groups = ham_op.group_commuting(qubit_wise=False)
+        evo = PauliEvolutionGate(ham_groups, time=time/num_trotter_steps, label=evo_label)
+
+        # Plug it into a circuit; num_qubits (= ham_op.num_qubits) is already
+        # bound locally, so skip the repeated property lookups on the operator
+        circuit = QuantumCircuit(num_qubits)
+        circuit_without_initial_state = QuantumCircuit(num_qubits)
         
         # first create and append the initial_state
         # init_state = "checkerboard"
         i_state = initial_state(num_qubits, init_state)
-        circuit.append(i_state, range(ham_op.num_qubits))
+        circuit.append(i_state, range(num_qubits))
         circuit.barrier()
         
         if n_spins <= 6:
@@ -334,8 +491,12 @@ def create_circuit(
         # convert_to_mirror_circuit adds its own measurement gates    
         if not (random_pauli_flag and method == 3):
             circuit.measure_all()
-    
-        return circuit, bitstring, ham_op, evo if not use_inverse_flag else evo.inverse()
+
+        ret_evo = evo if not use_inverse_flag else evo.inverse()
+        if cache_key is not None:
+            _circuit_cache[cache_key] = (circuit.copy(), bitstring, ham_op, ret_evo)
+
+        return circuit, bitstring, ham_op, ret_evo
 
     else:
         # print(f"Dataset not available for n_spins = {n_spins}.")
@@ -344,10 +505,31 @@ def create_circuit(
 
 ############### Initial Circuit Definition
 
+def _make_neele(n_spins: int) -> QuantumCircuit:
+    """Checkerboard state, or "Neele" state, with the X gates broadcast in one append."""
+    qc = QuantumCircuit(n_spins, name="Neele")
+    qc.x(list(range(0, n_spins, 2)))
+    return qc
+
+def _make_ghz(n_spins: int) -> QuantumCircuit:
+    """GHZ state: 1/sqrt(2) (|00...> + |11...>), with the CX chain broadcast in one append."""
+    qc = QuantumCircuit(n_spins, name="GHZ")
+    qc.h(0)
+    qc.cx(range(n_spins - 1), range(1, n_spins))
+    return qc
+
+# dispatch on the normalized state name instead of re-comparing string
+# literals on every call
+_INIT_DISPATCH = {
+    "checkerboard": _make_neele,
+    "neele": _make_neele,
+    "ghz": _make_ghz,
+}
+
 def initial_state(n_spins: int, init_state: str = "checker") -> QuantumCircuit:
     """
     Initialize the quantum state.
-    
+
     Args:
         n_spins (int): Number of spins (qubits).
         init_state (str): The chosen initial state. By default applies the checkerboard state, but can also be set to "ghz", the GHZ state.
@@ -355,23 +537,10 @@ def initial_state(n_spins: int, init_state: str = "checker") -> QuantumCircuit:
     Returns:
         QuantumCircuit: The initialized quantum circuit.
     """
-    qc = QuantumCircuit(n_spins)
-
-    init_state = init_state.strip().lower()
-    
-    if init_state == "checkerboard" or init_state == "neele":
-        # Checkerboard state, or "Neele" state
-        qc.name = "Neele"
-        for k in range(0, n_spins, 2):
-            qc.x([k])
-    elif init_state.strip().lower() == "ghz":
-        # GHZ state: 1/sqrt(2) (|00...> + |11...>)
-        qc.name = "GHZ"
-        qc.h(0)
-        for k in range(1, n_spins):
-            qc.cx(k-1, k)
-
-    return qc
+    make_state = _INIT_DISPATCH.get(init_state.strip().lower())
+    if make_state is None:
+        return QuantumCircuit(n_spins)
+    return make_state(n_spins)
 
 ############### Hamiltonian Circuit Definition
 
@@ -402,13 +571,8 @@ def HamiltonianSimulation(
     num_qubits = n_spins
     secret_int = f"{K}-{t}"
 
-    # Allocate qubits
-    qr = QuantumRegister(n_spins)
-    cr = ClassicalRegister(n_spins)
-    qc = QuantumCircuit(qr, cr, name=f"hamsim-{num_qubits}-{secret_int}")
-
     hamiltonian = hamiltonian.strip().lower()
-    
+
     # create the quantum circuit for this Hamiltonian, along with the correct pauli bstring,
     # the operator and trotter evolution circuit
     qc, bitstring, ham_op, evo = create_circuit(
@@ -422,6 +586,10 @@ def HamiltonianSimulation(
         random_init_flag=random_init_flag
         )
 
+    # name the returned circuit; no registers are allocated here since
+    # create_circuit builds its own and measure_all adds the classical bits
+    qc.name = f"hamsim-{num_qubits}-{secret_int}"
+
     # Save smaller circuit example for display
     global QC_, HAM_, EVO_, INV_
     if n_spins <= 6:
@@ -430,8 +598,12 @@ def HamiltonianSimulation(
         EVO_ = evo
         #INV_ = inv
             
-    # Collapse the sub-circuits used in this benchmark (for Qiskit)
-    qc2 = qc.decompose().decompose()
+    # Collapse the sub-circuits used in this benchmark (for Qiskit);
+    # decompose only the wrappers appended above (evolution gates and the
+    # initial state) in one DAG pass, instead of blanket-rebuilding the
+    # whole circuit twice
+    qc2 = qc.decompose(
+        gates_to_decompose=["PauliEvolution", "e^iHt", "Neele", "GHZ", "TrotterStep"])
 
     # return both the circuit created, the bitstring, and the Hamiltonian operator
     # if random_pauli_flag is false or method isn't 3, bitstring will be None
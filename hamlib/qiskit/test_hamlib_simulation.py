@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from qiskit.quantum_info import SparsePauliOp
+
+import hamlib_simulation_kernel as kernel
+
+
+def legacy_sparse_pauliop(terms, num_qubits):
+    """Reference construction via label strings, as the kernel originally did."""
+    pauli_list = []
+    for pauli_dict, coefficient in terms:
+        label = ["I"] * num_qubits
+        for qubit, op in pauli_dict.items():
+            label[qubit] = op
+        pauli_list.append(("".join(label), coefficient))
+    return SparsePauliOp.from_list(pauli_list)
+
+
+@pytest.mark.parametrize(
+    "terms,num_qubits",
+    [
+        # Y-containing terms must come through with no extra (-i)^{#Y} phase
+        ([({0: "X", 1: "X"}, 1.0), ({0: "Y", 1: "Y"}, 1.0), ({0: "Z", 1: "Z"}, 0.5)], 2),
+        ([({1: "Y"}, 0.25), ({0: "Y", 2: "Y"}, -1.0), ({0: "X", 1: "Y", 2: "Z"}, 2.0)], 3),
+        ([({0: "Z"}, 1.0), ({2: "X"}, -0.5)], 4),
+    ],
+)
+def test_sparse_pauliop_matches_from_list(terms, num_qubits):
+    got = kernel.sparse_pauliop(terms, num_qubits)
+    expected = legacy_sparse_pauliop(terms, num_qubits)
+
+    diff = (got - expected).simplify()
+    assert np.allclose(diff.coeffs, 0)
+
+
+def test_process_data_y_terms():
+    data = "(1.0) [X0 X1] + (1.0) [Y0 Y1] + (0.5) [Z0 Z1]"
+
+    ham_op, num_qubits = kernel.process_data(data)
+    assert num_qubits == 2
+
+    expected = SparsePauliOp.from_list([("XX", 1.0), ("YY", 1.0), ("ZZ", 0.5)])
+    diff = (ham_op - expected).simplify()
+    assert np.allclose(diff.coeffs, 0)